@@ -1,61 +1,39 @@
 import streamlit as st
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from fpdf import FPDF
-import json
-import tempfile
+import orjson
+from report import add_results_table, new_report, report_bytes
+from sim_core import ALPHA, simulate_batch
 
 # --- App Config ---
 st.set_page_config(page_title="CBDC Tax Base Simulator - Uganda", layout="wide")
 
 # --- Helper Functions ---
 
-def simulate_tax_base(baseline, adoption_rate, compliance_increase, tax_rate, years, alpha=0.5):
-    years_arr = np.arange(1, years + 1)
-    multiplier = 1 + alpha * (adoption_rate / 100) * (compliance_increase / 100) * years_arr
-    tax_base = baseline * multiplier
-    tax_revenue = tax_base * (tax_rate / 100)
-    df = pd.DataFrame({
-        "Year": years_arr,
-        "Tax Base (UGX Bn)": tax_base,
-        "Tax Revenue (UGX Bn)": tax_revenue
-    })
-    return df
+@st.cache_data(max_entries=128)
+def simulate_scenarios(baselines, adoption_rates, compliance_increases, tax_rates, years, alpha=ALPHA):
+    # All scenarios in one batched call; tuples of scalars keep the cache key hashable
+    return simulate_batch(baselines, adoption_rates, compliance_increases, tax_rates, years, alpha=alpha)
 
+@st.cache_data(max_entries=32)
 def generate_pdf(scenario_a, scenario_b, params_a, params_b, time_horizon):
-    pdf = FPDF()
-    pdf.add_page()
+    pdf = new_report()
     pdf.set_font("Arial", "B", 16)
     pdf.cell(0, 10, "CBDC Tax Base Simulation Report - Uganda", 0, 1, "C")
     pdf.ln(5)
 
-    def add_scenario_to_pdf(title, df, params):
+    def add_scenario_to_pdf(title, scenario, params):
         pdf.set_font("Arial", "B", 14)
         pdf.cell(0, 10, title, 0, 1)
         pdf.set_font("Arial", size=12)
         for k, v in params.items():
             pdf.cell(0, 8, f"{k}: {v}", 0, 1)
         pdf.ln(3)
-        pdf.set_font("Arial", "B", 12)
-        pdf.cell(25, 8, "Year", 1)
-        pdf.cell(50, 8, "Tax Base (UGX Bn)", 1)
-        pdf.cell(50, 8, "Tax Revenue (UGX Bn)", 1)
-        pdf.ln()
-        pdf.set_font("Arial", size=12)
-        for _, row in df.iterrows():
-            pdf.cell(25, 8, str(int(row["Year"])), 1)
-            pdf.cell(50, 8, f"{row['Tax Base (UGX Bn)']:.2f}", 1)
-            pdf.cell(50, 8, f"{row['Tax Revenue (UGX Bn)']:.2f}", 1)
-            pdf.ln()
+        add_results_table(pdf, *scenario, widths=(25, 50, 50), height=8)
         pdf.ln(8)
 
     add_scenario_to_pdf("Scenario A Parameters & Results", scenario_a, params_a)
     add_scenario_to_pdf("Scenario B Parameters & Results", scenario_b, params_b)
 
-    tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    pdf.output(tmp_file.name)
-    return tmp_file.name
+    return report_bytes(pdf)
 
 def save_simulation(params_a, params_b, time_horizon):
     data = {
@@ -63,16 +41,50 @@ def save_simulation(params_a, params_b, time_horizon):
         "scenario_b": params_b,
         "time_horizon": time_horizon
     }
-    json_str = json.dumps(data)
-    return json_str
+    return orjson.dumps(data)
 
-def load_simulation(json_str):
+def load_simulation(content):
+    # Accepts the uploaded bytes directly; orjson.loads also takes str
     try:
-        data = json.loads(json_str)
+        data = orjson.loads(content)
         return data.get("scenario_a"), data.get("scenario_b"), data.get("time_horizon")
     except Exception:
         return None, None, None
 
+def apply_loaded_simulation():
+    # on_change callback: runs before the script, so the input widgets' keys can still be set
+    uploaded = st.session_state.upload_json
+    if uploaded is None:
+        return
+    loaded_a, loaded_b, loaded_th = load_simulation(uploaded.getvalue())
+    st.session_state.load_ok = bool(loaded_a and loaded_b and loaded_th)
+    if st.session_state.load_ok:
+        st.session_state.update({
+            "ba": loaded_a["Baseline Tax Base (UGX Bn)"],
+            "aa": loaded_a["CBDC Adoption Rate (%)"],
+            "ca": loaded_a["Compliance Improvement (%)"],
+            "tra": loaded_a["Tax Rate (%)"],
+            "bb": loaded_b["Baseline Tax Base (UGX Bn)"],
+            "ab": loaded_b["CBDC Adoption Rate (%)"],
+            "cb": loaded_b["Compliance Improvement (%)"],
+            "trb": loaded_b["Tax Rate (%)"],
+            "th": loaded_th,
+        })
+
+# Button-driven sections run as fragments: clicking Save or the PDF button reruns
+# only that section instead of the whole script (simulations, charts, tables).
+@st.fragment
+def save_section(params_a, params_b, time_horizon):
+    if st.button("Save Current Simulation"):
+        json_bytes = save_simulation(params_a, params_b, time_horizon)
+        st.download_button("Download Simulation JSON", data=json_bytes, file_name="cbdc_simulation.json", mime="application/json")
+
+@st.fragment
+def pdf_report_section(scenario_a, scenario_b, params_a, params_b, time_horizon):
+    if st.button("📄 Download Combined Simulation Report (PDF)"):
+        pdf_bytes = generate_pdf(scenario_a, scenario_b, params_a, params_b, time_horizon)
+        st.download_button("Download PDF", data=pdf_bytes, file_name="CBDC_Simulation_Report_Uganda.pdf", mime="application/pdf")
+
 # --- UI ---
 
 st.title("📊 CBDC Impact on Tax Base Expansion in Uganda")
@@ -101,105 +113,73 @@ with col2:
 time_horizon = st.slider("Time Horizon (Years)", 1, 10, 5, key="th")
 
 # Run simulations
-df_a = simulate_tax_base(baseline_a, adoption_a, compliance_a, tax_rate_a, time_horizon)
-df_b = simulate_tax_base(baseline_b, adoption_b, compliance_b, tax_rate_b, time_horizon)
+years, tax_base, tax_revenue = simulate_scenarios(
+    (baseline_a, baseline_b), (adoption_a, adoption_b), (compliance_a, compliance_b), (tax_rate_a, tax_rate_b), time_horizon
+)
+tax_base_a, tax_base_b = tax_base
+tax_revenue_a, tax_revenue_b = tax_revenue
 
-# Display charts side by side
+# Charts
 st.subheader("📈 Tax Base Over Time")
-chart_col1, chart_col2 = st.columns(2)
-with chart_col1:
-    st.line_chart(df_a.set_index("Year")["Tax Base (UGX Bn)"], use_container_width=True)
-    st.caption("Scenario A Tax Base")
-with chart_col2:
-    st.line_chart(df_b.set_index("Year")["Tax Base (UGX Bn)"], use_container_width=True)
-    st.caption("Scenario B Tax Base")
+st.line_chart({"Year": years, "Scenario A": tax_base_a, "Scenario B": tax_base_b}, x="Year")
 
 st.subheader("📈 Tax Revenue Over Time")
-rev_col1, rev_col2 = st.columns(2)
-with rev_col1:
-    st.line_chart(df_a.set_index("Year")["Tax Revenue (UGX Bn)"], use_container_width=True)
-    st.caption("Scenario A Tax Revenue")
-with rev_col2:
-    st.line_chart(df_b.set_index("Year")["Tax Revenue (UGX Bn)"], use_container_width=True)
-    st.caption("Scenario B Tax Revenue")
+st.line_chart({"Year": years, "Scenario A": tax_revenue_a, "Scenario B": tax_revenue_b}, x="Year")
 
 # Final Year Summary
 st.subheader("📋 Final Year Comparison")
-final_a = df_a.iloc[-1]
-final_b = df_b.iloc[-1]
-
-final_df = pd.DataFrame({
+st.table({
     "Scenario": ["A", "B"],
-    "Tax Base (UGX Bn)": [final_a["Tax Base (UGX Bn)"], final_b["Tax Base (UGX Bn)"]],
-    "Tax Revenue (UGX Bn)": [final_a["Tax Revenue (UGX Bn)"], final_b["Tax Revenue (UGX Bn)"]],
+    "Tax Base (UGX Bn)": [f"{tax_base_a[-1]:.2f}", f"{tax_base_b[-1]:.2f}"],
+    "Tax Revenue (UGX Bn)": [f"{tax_revenue_a[-1]:.2f}", f"{tax_revenue_b[-1]:.2f}"],
 })
 
-st.table(final_df.style.format({"Tax Base (UGX Bn)": "{:.2f}", "Tax Revenue (UGX Bn)": "{:.2f}"}))
-
 # Save/load favorite simulations (simple JSON export/import)
 
 with st.expander("💾 Save / Load Favorite Simulations"):
     col_save, col_load = st.columns(2)
 
     with col_save:
-        if st.button("Save Current Simulation"):
-            params_a = {
-                "Baseline Tax Base (UGX Bn)": baseline_a,
-                "CBDC Adoption Rate (%)": adoption_a,
-                "Compliance Improvement (%)": compliance_a,
-                "Tax Rate (%)": tax_rate_a
-            }
-            params_b = {
-                "Baseline Tax Base (UGX Bn)": baseline_b,
-                "CBDC Adoption Rate (%)": adoption_b,
-                "Compliance Improvement (%)": compliance_b,
-                "Tax Rate (%)": tax_rate_b
-            }
-            json_str = save_simulation(params_a, params_b, time_horizon)
-            st.download_button("Download Simulation JSON", data=json_str, file_name="cbdc_simulation.json")
+        save_params_a = {
+            "Baseline Tax Base (UGX Bn)": baseline_a,
+            "CBDC Adoption Rate (%)": adoption_a,
+            "Compliance Improvement (%)": compliance_a,
+            "Tax Rate (%)": tax_rate_a
+        }
+        save_params_b = {
+            "Baseline Tax Base (UGX Bn)": baseline_b,
+            "CBDC Adoption Rate (%)": adoption_b,
+            "Compliance Improvement (%)": compliance_b,
+            "Tax Rate (%)": tax_rate_b
+        }
+        save_section(save_params_a, save_params_b, time_horizon)
 
     with col_load:
-        uploaded_file = st.file_uploader("Upload Simulation JSON", type=["json"])
+        uploaded_file = st.file_uploader(
+            "Upload Simulation JSON", type=["json"], key="upload_json", on_change=apply_loaded_simulation
+        )
         if uploaded_file is not None:
-            content = uploaded_file.read().decode("utf-8")
-            loaded_a, loaded_b, loaded_th = load_simulation(content)
-            if loaded_a and loaded_b and loaded_th:
+            if st.session_state.get("load_ok"):
                 st.success("Loaded saved simulation!")
-                # Set session state to update inputs
-                st.session_state.ba = loaded_a["Baseline Tax Base (UGX Bn)"]
-                st.session_state.aa = loaded_a["CBDC Adoption Rate (%)"]
-                st.session_state.ca = loaded_a["Compliance Improvement (%)"]
-                st.session_state.tra = loaded_a["Tax Rate (%)"]
-
-                st.session_state.bb = loaded_b["Baseline Tax Base (UGX Bn)"]
-                st.session_state.ab = loaded_b["CBDC Adoption Rate (%)"]
-                st.session_state.cb = loaded_b["Compliance Improvement (%)"]
-                st.session_state.trb = loaded_b["Tax Rate (%)"]
-
-                st.session_state.th = loaded_th
-                st.experimental_rerun()
             else:
                 st.error("Failed to load simulation file.")
 
 # PDF Report Generation and Download
-if st.button("📄 Download Combined Simulation Report (PDF)"):
-    params_a = {
-        "Baseline Tax Base": f"{baseline_a:.2f} UGX Bn",
-        "CBDC Adoption Rate": f"{adoption_a}%",
-        "Compliance Improvement": f"{compliance_a}%",
-        "Tax Rate": f"{tax_rate_a}%",
-        "Time Horizon": f"{time_horizon} years"
-    }
-    params_b = {
-        "Baseline Tax Base": f"{baseline_b:.2f} UGX Bn",
-        "CBDC Adoption Rate": f"{adoption_b}%",
-        "Compliance Improvement": f"{compliance_b}%",
-        "Tax Rate": f"{tax_rate_b}%",
-        "Time Horizon": f"{time_horizon} years"
-    }
-    pdf_path = generate_pdf(df_a, df_b, params_a, params_b, time_horizon)
-    with open(pdf_path, "rb") as f:
-        st.download_button("Download PDF", data=f, file_name="CBDC_Simulation_Report_Uganda.pdf", mime="application/pdf")
+report_params_a = {
+    "Baseline Tax Base": f"{baseline_a:.2f} UGX Bn",
+    "CBDC Adoption Rate": f"{adoption_a}%",
+    "Compliance Improvement": f"{compliance_a}%",
+    "Tax Rate": f"{tax_rate_a}%",
+    "Time Horizon": f"{time_horizon} years"
+}
+report_params_b = {
+    "Baseline Tax Base": f"{baseline_b:.2f} UGX Bn",
+    "CBDC Adoption Rate": f"{adoption_b}%",
+    "Compliance Improvement": f"{compliance_b}%",
+    "Tax Rate": f"{tax_rate_b}%",
+    "Time Horizon": f"{time_horizon} years"
+}
+pdf_report_section((years, tax_base_a, tax_revenue_a), (years, tax_base_b, tax_revenue_b), report_params_a, report_params_b, time_horizon)
 
 st.markdown("---")
 st.caption("Developed for Uganda CBDC Tax Base Expansion Simulation")
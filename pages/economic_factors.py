@@ -0,0 +1,178 @@
+import streamlit as st
+import pandas as pd
+from report import add_results_table, new_report, report_bytes
+from sim_core import CBDC, GDP, INFLATION, POPULATION, simulate
+
+st.set_page_config(page_title="CBDC Tax Base Simulator with Economic Factors - Uganda", layout="wide")
+
+st.title("🇺🇬 CBDC Impact Simulator on Uganda's Tax Base with Economic Factors")
+
+st.markdown("""
+This simulator models the potential impact of CBDC adoption on Uganda's tax base expansion,
+incorporating inflation, population growth, and GDP impact with **real-time economic data** from World Bank.
+""")
+
+# --- Fetch real-time Uganda GDP and Population from World Bank API ---
+@st.cache_resource
+def _world_bank_session():
+    # Shared across reruns and sessions so the connection is reused.
+    # requests is imported lazily: a disk-cached snapshot never needs it.
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=2))
+    return session
+
+@st.cache_data(persist="disk")
+def fetch_world_bank_data(indicator_codes):
+    # Both indicators in one request; the multi-indicator endpoint requires source=2.
+    # Errors propagate so a failed or incomplete fetch is never persisted to disk.
+    url = (
+        f"https://api.worldbank.org/v2/country/UGA/indicator/{';'.join(indicator_codes)}"
+        "?format=json&source=2&date=2023"
+    )
+    res = _world_bank_session().get(url, timeout=2)
+    res.raise_for_status()
+    values = {row["indicator"]["id"]: row["value"] for row in res.json()[1]}
+    if any(values.get(code) is None for code in indicator_codes):
+        # Not published yet; raise so a later publication is picked up
+        raise ValueError(f"World Bank data incomplete: {values}")
+    return values
+
+@st.cache_data(ttl=3600)
+def world_bank_snapshot(indicator_codes):
+    # Remember failures in memory only, so an outage doesn't block every rerun
+    try:
+        return fetch_world_bank_data(indicator_codes)
+    except Exception:
+        return {}
+
+# Reserve the top of the sidebar for the real-time data; it is filled at the end
+# of the script so a cold World Bank fetch doesn't hold up the simulation output
+wb_sidebar = st.sidebar.container()
+
+# --- User Inputs ---
+st.sidebar.header("Simulation Parameters")
+
+baseline_tax_base = st.sidebar.number_input(
+    "Baseline Annual Tax Base (UGX Billions)", min_value=100.0, value=5000.0, step=100.0,
+    help="Current estimated tax base in Uganda"
+)
+
+cbdc_adoption_rate = st.sidebar.slider("CBDC Adoption Rate (%)", min_value=0, max_value=100, value=50)
+compliance_improvement = st.sidebar.slider("Tax Compliance Improvement Due to CBDC (%)", min_value=0, max_value=100, value=20)
+effective_tax_rate = st.sidebar.slider("Effective Tax Rate (%)", min_value=0, max_value=50, value=15)
+time_horizon = st.sidebar.slider("Time Horizon (Years)", min_value=1, max_value=10, value=5)
+
+# Additional economic factors inputs
+inflation_rate = st.sidebar.slider("Annual Inflation Rate (%)", min_value=0.0, max_value=20.0, value=5.0, step=0.1)
+population_growth_rate = st.sidebar.slider("Annual Population Growth Rate (%)", min_value=0.0, max_value=10.0, value=3.0, step=0.1)
+
+# GDP impact factor (0-1) representing how much GDP growth affects tax base growth
+gdp_impact_factor = st.sidebar.slider("GDP Impact Factor on Tax Base (0-1)", min_value=0.0, max_value=1.0, value=0.5, step=0.05)
+
+# --- Calculate baseline annual GDP growth rate from World Bank if data is available ---
+def estimate_gdp_growth_rate():
+    # For demo, assume 5% if no data
+    # In practice, fetch historical data for growth calculation
+    return 0.05
+
+gdp_growth_rate = estimate_gdp_growth_rate()
+
+# --- Simulation logic ---
+@st.cache_data(max_entries=128)
+def run_sim(baseline, adoption, compliance, rate, inflation, popgrowth, gdp_growth, gdp_impact, horizon):
+    years, tax_base, tax_revenue, factors = simulate(
+        baseline, adoption, compliance, rate, horizon,
+        inflation=inflation, pop=popgrowth, gdp_g=gdp_growth, gdp_f=gdp_impact
+    )
+    return pd.DataFrame({
+        "Year": years,
+        "Tax Base (UGX Billions)": tax_base,
+        "Tax Revenue (UGX Billions)": tax_revenue,
+        "Inflation Factor": factors[INFLATION],
+        "Population Factor": factors[POPULATION],
+        "GDP Factor": factors[GDP],
+        "CBDC Impact Multiplier": factors[CBDC]
+    })
+
+# Results DataFrame
+df_results = run_sim(
+    baseline_tax_base, cbdc_adoption_rate, compliance_improvement, effective_tax_rate,
+    inflation_rate, population_growth_rate, gdp_growth_rate, gdp_impact_factor, time_horizon
+)
+
+# --- Outputs ---
+st.subheader("📈 Tax Base & Revenue Projection")
+
+st.line_chart(df_results, x="Year", y=["Tax Base (UGX Billions)", "Tax Revenue (UGX Billions)"])
+
+# Formatted display table
+display_formats = {
+    "Tax Base (UGX Billions)": "{:,.2f}",
+    "Tax Revenue (UGX Billions)": "{:,.2f}",
+    "Inflation Factor": "{:.3f}",
+    "Population Factor": "{:.3f}",
+    "GDP Factor": "{:.3f}",
+    "CBDC Impact Multiplier": "{:.3f}"
+}
+df_display = df_results.copy()
+for col, fmt in display_formats.items():
+    df_display[col] = df_results[col].map(fmt.format)
+
+st.dataframe(df_display)
+
+# --- PDF Report Generation ---
+@st.cache_data(max_entries=32)
+def generate_pdf_report(df, params):
+    pdf = new_report()
+    pdf.set_font("Arial", "B", 16)
+    pdf.cell(0, 10, "CBDC Tax Base Impact Simulation Report - Uganda", 0, 1, "C")
+
+    pdf.set_font("Arial", "", 12)
+    pdf.ln(5)
+    pdf.cell(0, 10, "Simulation Parameters:", 0, 1)
+    for k, v in params.items():
+        pdf.cell(0, 8, f"{k}: {v}", 0, 1)
+
+    pdf.ln(5)
+    add_results_table(
+        pdf,
+        df["Year"].to_numpy(),
+        df["Tax Base (UGX Billions)"].to_numpy(),
+        df["Tax Revenue (UGX Billions)"].to_numpy(),
+        widths=(20, 50, 50),
+        height=10,
+    )
+
+    return report_bytes(pdf)
+
+# Prepare parameters for PDF
+params = {
+    "Baseline Tax Base (UGX Billions)": f"{baseline_tax_base:,.2f}",
+    "CBDC Adoption Rate (%)": f"{cbdc_adoption_rate}%",
+    "Compliance Improvement (%)": f"{compliance_improvement}%",
+    "Effective Tax Rate (%)": f"{effective_tax_rate}%",
+    "Time Horizon (Years)": f"{time_horizon}",
+    "Inflation Rate (%)": f"{inflation_rate}%",
+    "Population Growth Rate (%)": f"{population_growth_rate}%",
+    "GDP Impact Factor": f"{gdp_impact_factor}",
+}
+
+# Fragment: the report button reruns only this section, not the whole page
+@st.fragment
+def pdf_report_section(df, params):
+    if st.button("📄 Download PDF Report"):
+        pdf_bytes = generate_pdf_report(df, params)
+        st.download_button("Download Report", pdf_bytes, file_name="CBDC_Uganda_Tax_Simulation_Report.pdf", mime="application/pdf")
+
+pdf_report_section(df_results, params)
+
+# Display real-time data in sidebar
+with wb_sidebar.expander("Real-time Economic Data (2023):", expanded=True):
+    wb_data = world_bank_snapshot(("NY.GDP.MKTP.CD", "SP.POP.TOTL"))
+    latest_gdp = wb_data.get("NY.GDP.MKTP.CD")  # GDP current US$
+    latest_population = wb_data.get("SP.POP.TOTL")  # Total population
+    st.write(f"🇺🇬 Uganda GDP (current US$): **{latest_gdp:,.0f}**" if latest_gdp else "GDP data unavailable")
+    st.write(f"🇺🇬 Uganda Population: **{latest_population:,.0f}**" if latest_population else "Population data unavailable")
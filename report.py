@@ -0,0 +1,36 @@
+import numpy as np
+
+# PDF report helpers shared by the Streamlit pages. fpdf is imported lazily,
+# so it is only loaded once a report is actually requested.
+
+
+def new_report():
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.add_page()
+    return pdf
+
+
+def report_bytes(pdf):
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def add_results_table(pdf, years, tax_base, tax_revenue, widths, height):
+    # Year / tax base / tax revenue grid; widths is (year, base, revenue)
+    year_w, base_w, rev_w = widths
+    pdf.set_font("Arial", "B", 12)
+    pdf.cell(year_w, height, "Year", 1)
+    pdf.cell(base_w, height, "Tax Base (UGX Bn)", 1)
+    pdf.cell(rev_w, height, "Tax Revenue (UGX Bn)", 1)
+    pdf.ln()
+
+    pdf.set_font("Arial", "", 12)
+    # Columns are formatted once up front; the last cell of each row ends the line (ln=1)
+    years_s = years.astype(str)
+    base_s = np.char.mod("%.2f", tax_base)
+    rev_s = np.char.mod("%.2f", tax_revenue)
+    for y, b, r in zip(years_s, base_s, rev_s):
+        pdf.cell(year_w, height, y, 1)
+        pdf.cell(base_w, height, b, 1)
+        pdf.cell(rev_w, height, r, 1, 1)
@@ -0,0 +1,55 @@
+import numpy as np
+from numba import vectorize
+
+# Pure numeric core shared by the Streamlit pages; no UI imports here.
+
+ALPHA = 0.5  # CBDC sensitivity coefficient
+
+# Rows of the per-year factor matrix returned by simulate()
+CBDC, INFLATION, POPULATION, GDP = range(4)
+
+
+@vectorize(["f8(f8, f8, f8, f8, f8, f8, f8)"], fastmath=True, cache=True)
+def _tax_base(y, baseline, k, infl_step, pop_step, gdp_step, gdp_f):
+    # Element-wise tax base for year y, compiled to a NumPy ufunc so it
+    # broadcasts over years and scenario grids in a single loop
+    gdpf = gdp_step ** y * gdp_f + (1.0 - gdp_f)
+    return baseline * (1.0 + k * y) * infl_step ** y * pop_step ** y * gdpf
+
+
+def _column(values):
+    # Scalar or (S,) parameters -> (S, 1) so they broadcast against the (N,) years;
+    # a scalar becomes (1, 1), keeping the results 2-D
+    return np.atleast_1d(np.asarray(values, dtype=np.float64))[:, None]
+
+
+def simulate_batch(baseline, adoption, compliance, rate, horizon, *,
+                   inflation=0.0, pop=0.0, gdp_g=0.0, gdp_f=0.0, alpha=ALPHA):
+    # Vectorized over scenarios: each parameter is a scalar or a length-S
+    # sequence (S = 1 when all are scalars). Returns (years, tax_base,
+    # tax_revenue) with the two result matrices shaped (S, horizon).
+    years = np.arange(1, horizon + 1)
+    k = alpha * _column(adoption) * _column(compliance) * 1e-4
+    base = _tax_base(
+        years, _column(baseline), k, 1.0 + _column(inflation) * 0.01,
+        1.0 + _column(pop) * 0.01, 1.0 + _column(gdp_g), _column(gdp_f)
+    )
+    return years, base, base * (_column(rate) * 0.01)
+
+
+def simulate(baseline, adoption, compliance, rate, horizon, *,
+             inflation=0.0, pop=0.0, gdp_g=0.0, gdp_f=0.0, alpha=ALPHA):
+    # Single scenario with its factor breakdown; simulate_batch covers the rest.
+    # The tax base is the product of the factor rows.
+    # Rates are percentages except gdp_g (a fraction) and gdp_f (a 0-1 weight).
+    # Returns (years, tax_base, tax_revenue, factors), where factors is the
+    # (4, horizon) matrix of CBDC/inflation/population/GDP multipliers.
+    years = np.arange(1, horizon + 1)
+    # Years are contiguous, so compound growth is a running product, not a pow per year
+    cbdc = 1.0 + alpha * adoption * compliance * 1e-4 * years
+    inflation_factor = np.cumprod(np.full(horizon, 1.0 + inflation * 0.01))
+    population_factor = np.cumprod(np.full(horizon, 1.0 + pop * 0.01))
+    gdp_factor = np.cumprod(np.full(horizon, 1.0 + gdp_g)) * gdp_f + (1.0 - gdp_f)
+    factors = np.stack([cbdc, inflation_factor, population_factor, gdp_factor])
+    base = baseline * factors.prod(axis=0)
+    return years, base, base * (rate * 0.01), factors